@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import struct
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from extract_texture_filename_from_3ds import iter_3ds_chunks, read_cstring
+
+IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+# glTF constants
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+
+
+def parse_3ds(data):
+    """
+    Extracts meshes and materials from the contents of a .3ds file.
+
+    Vertex (0x4110), face (0x4120) and UV (0x4140) chunks are mapped straight
+    into NumPy arrays without copying or per-vertex Python loops.
+
+    Args:
+        data (bytes): Complete file contents.
+
+    Returns:
+        Tuple[List[dict], Dict[str, dict]]: Meshes (name, positions, faces, uvs,
+        face_materials) and materials by name (texture filename).
+    """
+    meshes = []
+    materials = {}
+    object_name = None
+    mesh = None
+    material = None
+    texture_slot = None
+
+    for chunk_id, payload, _ in iter_3ds_chunks(data):
+        if chunk_id == 0x4000:  # Object Block
+            object_name, _ = read_cstring(data, payload)
+        elif chunk_id == 0x4100:  # Triangular Mesh
+            mesh = {
+                "name": object_name,
+                "positions": None,
+                "faces": None,
+                "uvs": None,
+                "face_materials": [],
+            }
+            meshes.append(mesh)
+        elif chunk_id == 0x4110 and mesh is not None:  # Vertices List
+            count, = struct.unpack_from('<H', data, payload)
+            mesh["positions"] = np.frombuffer(
+                data, dtype='<f4', count=count * 3, offset=payload + 2
+            ).reshape(count, 3)
+        elif chunk_id == 0x4120 and mesh is not None:  # Faces Description
+            count, = struct.unpack_from('<H', data, payload)
+            # a, b, c, flags per face - flags are dropped
+            mesh["faces"] = np.frombuffer(
+                data, dtype='<u2', count=count * 4, offset=payload + 2
+            ).reshape(count, 4)[:, :3]
+        elif chunk_id == 0x4130 and mesh is not None:  # Faces Material
+            name, offset = read_cstring(data, payload)
+            count, = struct.unpack_from('<H', data, offset)
+            face_ids = np.frombuffer(data, dtype='<u2', count=count, offset=offset + 2)
+            mesh["face_materials"].append((name, face_ids))
+        elif chunk_id == 0x4140 and mesh is not None:  # Mapping Coordinates List
+            count, = struct.unpack_from('<H', data, payload)
+            mesh["uvs"] = np.frombuffer(
+                data, dtype='<f4', count=count * 2, offset=payload + 2
+            ).reshape(count, 2)
+        elif chunk_id == 0xAFFF:  # Material Block
+            material = {"name": None, "texture": None}
+            texture_slot = None
+        elif chunk_id == 0xA000 and material is not None:  # Material Name
+            material["name"], _ = read_cstring(data, payload)
+            materials[material["name"]] = material
+        elif chunk_id in (0xA200, 0xA33A, 0xA210, 0xA230, 0xA204, 0xA220):
+            texture_slot = chunk_id
+        elif chunk_id == 0xA300 and material is not None:  # Mapping Filename
+            if texture_slot == 0xA200 and material["texture"] is None:
+                material["texture"], _ = read_cstring(data, payload)
+
+    meshes = [
+        m for m in meshes
+        if m["positions"] is not None and len(m["positions"])
+        and m["faces"] is not None and len(m["faces"])
+    ]
+    return meshes, materials
+
+
+def compute_normals(positions, faces):
+    """
+    Area-weighted vertex normals, accumulated with np.add.at.
+    """
+    tris = positions[faces]
+    face_normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    normals = np.zeros_like(positions)
+    for corner in range(3):
+        np.add.at(normals, faces[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    lengths[lengths == 0] = 1.0
+    return (normals / lengths).astype(np.float32)
+
+
+def find_texture(texture_name, search_dirs):
+    """
+    Resolves a texture reference (often an upper-case 8.3 name) case-insensitively.
+    """
+    wanted = os.path.basename(texture_name.replace("\\", "/")).lower()
+    for directory in search_dirs:
+        if not os.path.isdir(directory):
+            continue
+        for fname in os.listdir(directory):
+            if fname.lower() == wanted:
+                return os.path.join(directory, fname)
+    return None
+
+
+def load_texture(path):
+    """
+    Returns (bytes, mime type) for a texture, converting to PNG via Pillow if the
+    format is not supported by glTF. Returns None if that is not possible.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in IMAGE_MIME_TYPES:
+        with open(path, "rb") as f:
+            return f.read(), IMAGE_MIME_TYPES[ext]
+    try:
+        from io import BytesIO
+        from PIL import Image
+    except ImportError:
+        print(f"  ⚠️  {os.path.basename(path)}: format not supported by glTF, install Pillow to convert it", file=sys.stderr)
+        return None
+    out = BytesIO()
+    Image.open(path).save(out, format="PNG")
+    return out.getvalue(), "image/png"
+
+
+class GlbBuilder:
+    """
+    Collects binary data, buffer views and accessors for a single-buffer GLB.
+    """
+
+    def __init__(self):
+        self.gltf = {
+            "asset": {"version": "2.0", "generator": "convert_3ds_to_glb.py"},
+            "scene": 0,
+            "scenes": [{"nodes": []}],
+            "nodes": [],
+            "meshes": [],
+            "materials": [],
+            "textures": [],
+            "images": [],
+            "samplers": [{}],
+            "accessors": [],
+            "bufferViews": [],
+            "buffers": [],
+        }
+        self.chunks = []
+        self.length = 0
+
+    def add_buffer_view(self, blob, target=None):
+        padding = (-self.length) % 4
+        if padding:
+            self.chunks.append(b"\x00" * padding)
+            self.length += padding
+        view = {"buffer": 0, "byteOffset": self.length, "byteLength": len(blob)}
+        if target is not None:
+            view["target"] = target
+        self.chunks.append(blob)
+        self.length += len(blob)
+        self.gltf["bufferViews"].append(view)
+        return len(self.gltf["bufferViews"]) - 1
+
+    def add_accessor(self, array, accessor_type, target, with_bounds=False):
+        array = np.ascontiguousarray(array)
+        component_type = FLOAT if array.dtype == np.float32 else UNSIGNED_SHORT
+        accessor = {
+            "bufferView": self.add_buffer_view(array.tobytes(), target),
+            "componentType": component_type,
+            "count": len(array),
+            "type": accessor_type,
+        }
+        if with_bounds:
+            accessor["min"] = array.min(axis=0).tolist()
+            accessor["max"] = array.max(axis=0).tolist()
+        self.gltf["accessors"].append(accessor)
+        return len(self.gltf["accessors"]) - 1
+
+    def add_material(self, name, image=None):
+        material = {
+            "name": name,
+            "pbrMetallicRoughness": {"metallicFactor": 0.0, "roughnessFactor": 1.0},
+        }
+        if image is not None:
+            blob, mime_type = image
+            self.gltf["images"].append({"bufferView": self.add_buffer_view(blob), "mimeType": mime_type})
+            self.gltf["textures"].append({"sampler": 0, "source": len(self.gltf["images"]) - 1})
+            material["pbrMetallicRoughness"]["baseColorTexture"] = {"index": len(self.gltf["textures"]) - 1}
+        self.gltf["materials"].append(material)
+        return len(self.gltf["materials"]) - 1
+
+    def to_bytes(self):
+        gltf = {k: v for k, v in self.gltf.items() if v != []}
+        binary = b"".join(self.chunks)
+        binary += b"\x00" * ((-len(binary)) % 4)
+        gltf["buffers"] = [{"byteLength": len(binary)}]
+        json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+        json_chunk += b" " * ((-len(json_chunk)) % 4)
+        total = 12 + 8 + len(json_chunk) + 8 + len(binary)
+        return b"".join([
+            struct.pack("<4sII", b"glTF", 2, total),
+            struct.pack("<I4s", len(json_chunk), b"JSON"), json_chunk,
+            struct.pack("<I4s", len(binary), b"BIN\x00"), binary,
+        ])
+
+
+def build_glb(meshes, materials, texture_dirs):
+    """
+    Assembles a GLB from parsed 3DS meshes. 3DS is Z-up, glTF is Y-up.
+    """
+    builder = GlbBuilder()
+    material_ids = {}
+
+    def material_index(name):
+        if name not in material_ids:
+            image = None
+            texture = materials.get(name, {}).get("texture")
+            if texture:
+                path = find_texture(texture, texture_dirs)
+                if path:
+                    image = load_texture(path)
+                else:
+                    print(f"  ⚠️  Texture not found: {texture}", file=sys.stderr)
+            material_ids[name] = builder.add_material(name, image)
+        return material_ids[name]
+
+    for mesh in meshes:
+        x, y, z = mesh["positions"].T
+        positions = np.column_stack((x, z, -y)).astype(np.float32)
+        faces = mesh["faces"]
+
+        # One primitive per material, plus one for faces without material
+        unassigned = np.ones(len(faces), dtype=bool)
+        groups = []
+        for name, face_ids in mesh["face_materials"]:
+            unassigned[face_ids] = False
+            groups.append((name, faces[face_ids]))
+        if unassigned.any():
+            groups.append((None, faces[unassigned]))
+        groups = [(name, group) for name, group in groups if len(group)]
+        if not groups:
+            continue  # a glTF mesh needs at least one primitive
+
+        attributes = {
+            "POSITION": builder.add_accessor(positions, "VEC3", ARRAY_BUFFER, with_bounds=True),
+            "NORMAL": builder.add_accessor(compute_normals(positions, faces), "VEC3", ARRAY_BUFFER),
+        }
+        if mesh["uvs"] is not None and len(mesh["uvs"]) == len(positions):
+            uvs = mesh["uvs"].astype(np.float32)
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+            attributes["TEXCOORD_0"] = builder.add_accessor(uvs, "VEC2", ARRAY_BUFFER)
+
+        primitives = []
+        for name, group in groups:
+            primitive = {
+                "attributes": attributes,
+                "indices": builder.add_accessor(group.reshape(-1), "SCALAR", ELEMENT_ARRAY_BUFFER),
+            }
+            if name is not None:
+                primitive["material"] = material_index(name)
+            primitives.append(primitive)
+
+        builder.gltf["meshes"].append({"name": mesh["name"], "primitives": primitives})
+        builder.gltf["nodes"].append({"name": mesh["name"], "mesh": len(builder.gltf["meshes"]) - 1})
+        builder.gltf["scenes"][0]["nodes"].append(len(builder.gltf["nodes"]) - 1)
+
+    return builder.to_bytes()
+
+
+def convert_file(input_path, output_path, texture_dirs=()):
+    """
+    Converts a single .3ds file to .glb.
+
+    Args:
+        input_path (str): Path to the .3ds file.
+        output_path (str): Path of the .glb to write.
+        texture_dirs (Iterable[str]): Extra directories searched for textures
+            (the directory of the .3ds file is always searched first).
+
+    Returns:
+        int: Number of meshes written.
+    """
+    with open(input_path, "rb") as f:
+        data = f.read()
+    meshes, materials = parse_3ds(data)
+    if not meshes:
+        raise ValueError("no triangle meshes found")
+    search_dirs = [os.path.dirname(os.path.abspath(input_path)), *texture_dirs]
+    glb = build_glb(meshes, materials, search_dirs)
+    with open(output_path, "wb") as f:
+        f.write(glb)
+    return len(meshes)
+
+
+def convert_directory(input_dir, output_dir, texture_dirs=(), jobs=None):
+    """
+    Converts every .3ds file in input_dir in parallel worker processes.
+
+    Returns:
+        Tuple[int, int]: (converted, failed)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    files = sorted(f for f in os.listdir(input_dir) if f.lower().endswith(".3ds"))
+    converted = failed = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(
+                convert_file,
+                os.path.join(input_dir, fname),
+                os.path.join(output_dir, os.path.splitext(fname)[0] + ".glb"),
+                tuple(texture_dirs),
+            ): fname
+            for fname in files
+        }
+        for future in as_completed(futures):
+            fname = futures[future]
+            try:
+                mesh_count = future.result()
+            except Exception as e:
+                print(f"  ⚠️  {fname}: {e}", file=sys.stderr)
+                failed += 1
+            else:
+                print(f"  ✅ {fname} ({mesh_count} meshes)")
+                converted += 1
+    return converted, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert .3ds models (or whole directories) to .glb without a Blender round-trip"
+    )
+    parser.add_argument("input", help="A .3ds file or a directory containing .3ds files")
+    parser.add_argument(
+        "--output", "-o",
+        help="Output .glb (single file) or output directory (defaults next to the input)",
+    )
+    parser.add_argument(
+        "--textures", "-t",
+        action="append",
+        default=[],
+        help="Additional directory to search for textures (repeatable)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Number of worker processes for directory conversion (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input):
+        converted, failed = convert_directory(args.input, args.output or args.input, args.textures, args.jobs)
+        print(f"{converted} converted, {failed} failed.")
+        sys.exit(1 if failed else 0)
+
+    output = args.output or os.path.splitext(args.input)[0] + ".glb"
+    try:
+        mesh_count = convert_file(args.input, output, args.textures)
+    except Exception as e:
+        print(f"Error: {args.input}: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Saved {output} ({mesh_count} meshes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,70 @@
 import struct
 import sys
 
+# Chunks whose payload consists (after an optional prefix) of further chunks.
+CONTAINER_CHUNKS = {
+    0x4D4D,  # Main
+    0x3D3D,  # 3D Editor
+    0x4000,  # Object Block (prefixed by a null-terminated object name)
+    0x4100,  # Triangular Mesh
+    0x4120,  # Faces Description (prefixed by the face list)
+    0xAFFF,  # Material Block
+    0xA200,  # Texture Map 1
+    0xA33A,  # Texture Map 2
+    0xA210,  # Opacity Map
+    0xA230,  # Bump Map
+    0xA204,  # Specular Map
+    0xA220,  # Reflection Map
+}
+
+
+def read_cstring(data, offset):
+    """
+    Reads a null-terminated string starting at offset.
+
+    Returns:
+        Tuple[str, int]: The decoded string and the offset after the terminator.
+    """
+    end = data.index(b'\x00', offset)
+    raw = bytes(data[offset:end])
+    try:
+        name = raw.decode('ascii')
+    except UnicodeDecodeError:
+        name = raw.decode('latin-1')
+    return name, end + 1
+
+
+def iter_3ds_chunks(data, start=0, end=None):
+    """
+    Walks the chunk tree of a .3ds file, descending into container chunks.
+
+    Args:
+        data (bytes): Complete file contents.
+        start (int): Offset of the first chunk header.
+        end (int): Offset where the walk stops (defaults to len(data)).
+
+    Yields:
+        Tuple[int, int, int]: (chunk_id, payload_start, chunk_end) for every chunk.
+    """
+    if end is None:
+        end = len(data)
+    pos = start
+    while pos + 6 <= end:
+        chunk_id, chunk_len = struct.unpack_from('<HI', data, pos)
+        if chunk_len < 6:
+            break
+        chunk_end = min(pos + chunk_len, end)
+        payload = pos + 6
+        yield chunk_id, payload, chunk_end
+        if chunk_id in CONTAINER_CHUNKS:
+            if chunk_id == 0x4000:
+                _, payload = read_cstring(data, payload)
+            elif chunk_id == 0x4120:
+                face_count, = struct.unpack_from('<H', data, payload)
+                payload += 2 + face_count * 8
+            yield from iter_3ds_chunks(data, payload, chunk_end)
+        pos = chunk_end
+
 
 def extract_3ds_texture_paths(three_ds_path):
     """
@@ -12,32 +76,13 @@ def extract_3ds_texture_paths(three_ds_path):
     Returns:
         List[str]: Texture filenames referenced in the .3ds file.
     """
-    paths = []
     with open(three_ds_path, 'rb') as f:
-        while True:
-            header = f.read(6)
-            if len(header) < 6:
-                break
-            chunk_id, chunk_len = struct.unpack('<HI', header)
-            data_len = chunk_len - 6
-            if chunk_id == 0xA300:  # Mapping Filename
-                name_bytes = b''
-                # Read until null terminator
-                while True:
-                    c = f.read(1)
-                    if not c or c == b'\x00':
-                        break
-                    name_bytes += c
-                try:
-                    name = name_bytes.decode('ascii')
-                except UnicodeDecodeError:
-                    name = name_bytes.decode('latin-1')
-                paths.append(name)
-                # Skip any leftover bytes in this chunk
-                f.seek(data_len - len(name_bytes) - 1, 1)
-            else:
-                # Skip this chunk's data
-                f.seek(data_len, 1)
+        data = f.read()
+    paths = []
+    for chunk_id, payload, _ in iter_3ds_chunks(data):
+        if chunk_id == 0xA300:  # Mapping Filename
+            name, _ = read_cstring(data, payload)
+            paths.append(name)
     return paths
 
 
@@ -58,4 +103,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
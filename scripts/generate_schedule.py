@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import random
+import argparse
+import urllib.parse
+
+# Paths relative to the repository root
+PUBLIC_DIR = os.path.join("server", "public")
+SPIRIT_LIST = os.path.join("server", "spirits", "spirit_list.json")
+SCHEDULE_PATH = os.path.join("server", "spirits", "spirit_schedule.json")
+SPIRIT_INTERVAL_MS = 18000  # muss zu server.js passen
+
+
+def asset_size(url, public_dir):
+    """
+    Byte size of the file behind a public URL, or None if it does not exist.
+    """
+    if not url:
+        return None
+    path = os.path.join(public_dir, urllib.parse.unquote(url).lstrip("/"))
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def spread_large(spirits, large, rng):
+    """
+    Seeded order in which large models are spaced as evenly as possible.
+
+    Large and small spirits are shuffled separately; the large ones are then
+    placed at evenly spaced slots. The schedule loops, so the gap across the
+    wrap-around counts as well. No two large models are adjacent as long as
+    at most half of the spirits are large. The slots are offset by half a
+    spacing so that slot 0 - sent on startup and after every wrap-around,
+    when nothing can have been prefetched - gets a small model.
+    """
+    big = [s for s, is_large in zip(spirits, large) if is_large]
+    small = [s for s, is_large in zip(spirits, large) if not is_large]
+    rng.shuffle(big)
+    rng.shuffle(small)
+    n = len(spirits)
+    big_slots = {(2 * i + 1) * n // (2 * len(big)) for i in range(len(big))}
+    big_iter = iter(big)
+    small_iter = iter(small)
+    return [next(big_iter) if i in big_slots else next(small_iter) for i in range(n)]
+
+
+def build_schedule(spirits, public_dir, seed, prefetch, large_percentile):
+    """
+    Builds the rotation schedule with a per-slot prefetch manifest.
+
+    Slots only reference spirits by their index in the list; Name and Model
+    URL are stored so the server can detect a schedule that no longer matches
+    spirit_list.json.
+
+    Args:
+        spirits (List[dict]): Entries of spirit_list.json.
+        public_dir (str): Directory the asset URLs are served from.
+        seed (int): Seed for the deterministic order.
+        prefetch (int): Number of upcoming slots listed per slot.
+        large_percentile (float): Models above this size percentile count as large.
+
+    Returns:
+        dict: Schedule document (see SCHEDULE_PATH).
+    """
+    rng = random.Random(seed)
+    model_bytes = [asset_size(s.get("Model URL"), public_dir) or 0 for s in spirits]
+    sizes = sorted(model_bytes)
+    threshold = sizes[min(int(len(sizes) * large_percentile / 100), len(sizes) - 1)]
+    large = [b > threshold for b in model_bytes]
+
+    order = spread_large(list(range(len(spirits))), large, rng)
+
+    slots = []
+    for slot, idx in enumerate(order):
+        spirit = spirits[idx]
+        slots.append({
+            "slot": slot,
+            "index": idx,
+            "Name": spirit.get("Name"),
+            "Model URL": spirit.get("Model URL"),
+            "modelBytes": model_bytes[idx],
+            "imageBytes": asset_size(spirit.get("Image URL"), public_dir) or 0,
+            "large": large[idx],
+        })
+
+    for slot in slots:
+        upcoming = []
+        for k in range(1, min(prefetch, len(slots) - 1) + 1):
+            nxt = slots[(slot["slot"] + k) % len(slots)]
+            for field, size_field in (("Model URL", "modelBytes"), ("Image URL", "imageBytes")):
+                url = spirits[nxt["index"]].get(field)
+                if url:
+                    upcoming.append({"url": url, "bytes": nxt[size_field]})
+        slot["prefetch"] = upcoming
+
+    adjacent = sum(1 for i, s in enumerate(slots) if s["large"] and slots[i - 1]["large"])
+    return {
+        "seed": seed,
+        "spiritIntervalMs": SPIRIT_INTERVAL_MS,
+        "spiritCount": len(spirits),
+        "prefetch": prefetch,
+        "largeModelBytes": threshold,
+        "adjacentLarge": adjacent,
+        "slots": slots,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic spirit rotation schedule with prefetch manifest"
+    )
+    parser.add_argument(
+        "--root", "-r",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+        help="Repository root (default: parent of the scripts directory)",
+    )
+    parser.add_argument("--input", "-i", help=f"Spirit list (default: <root>/{SPIRIT_LIST})")
+    parser.add_argument("--output", "-o", help=f"Schedule file (default: <root>/{SCHEDULE_PATH})")
+    parser.add_argument("--seed", "-s", type=int, default=0, help="Seed for the rotation order")
+    parser.add_argument(
+        "--prefetch", "-n",
+        type=int,
+        default=2,
+        help="Number of upcoming spirits listed in each slot's prefetch manifest",
+    )
+    parser.add_argument(
+        "--large_percentile",
+        type=float,
+        default=75,
+        help="Models above this size percentile must not follow each other",
+    )
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    input_path = args.input or os.path.join(root, SPIRIT_LIST)
+    output_path = args.output or os.path.join(root, SCHEDULE_PATH)
+
+    try:
+        with open(input_path, "r", encoding="utf-8") as f:
+            spirits = json.load(f)
+    except Exception as e:
+        print(f"Error: could not load {input_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not isinstance(spirits, list) or not spirits:
+        print("Error: the spirit list must be a non-empty list.", file=sys.stderr)
+        sys.exit(1)
+
+    schedule = build_schedule(spirits, os.path.join(root, PUBLIC_DIR), args.seed, args.prefetch, args.large_percentile)
+
+    missing = [s["Name"] or "???" for s in schedule["slots"] if not s["modelBytes"]]
+    for name in missing:
+        print(f"Model not found: {name}", file=sys.stderr)
+    if schedule["adjacentLarge"]:
+        print(f"Warning: {schedule['adjacentLarge']} large models follow each other (too many large models).")
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(schedule, f, indent=2, ensure_ascii=False)
+    print(f"{len(schedule['slots'])} slots written to {output_path} (seed {args.seed}).")
+
+
+if __name__ == "__main__":
+    main()
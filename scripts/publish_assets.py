@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import tempfile
+import urllib.parse
+
+# Paths relative to the repository root
+PUBLIC_DIR = os.path.join("server", "public")
+ASSETS_DIR = os.path.join(PUBLIC_DIR, "assets")
+STORE_DIR = os.path.join(PUBLIC_DIR, "cas")
+STORE_URL_PREFIX = "/cas/"
+SPIRIT_LIST = os.path.join("server", "spirits", "spirit_list.json")
+# Changes on every publish, so it must not live in the immutable store
+MANIFEST_PATH = os.path.join("server", "spirits", "asset-manifest.json")
+URL_FIELDS = ("Model URL", "Image URL")
+HASH_LENGTH = 16
+
+
+def file_digest(path, block_size=1 << 20):
+    """
+    Returns the SHA-256 hex digest of a file, read in blocks.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def store_copy(src, dst):
+    """
+    Copies src into the store as a read-only file.
+
+    The copy is written to a temporary file and renamed into place, so a
+    store entry is never visible half-written and never shares an inode
+    with a (mutable) source file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dst), suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, dst)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def publish(assets_dir, store_dir, public_dir):
+    """
+    Writes every file under assets_dir once into the content-addressed store.
+
+    Store entries are named after the content hash, so identical files under
+    different names share one entry. Existing entries whose content no longer
+    matches their name are replaced.
+
+    Returns:
+        Tuple[Dict[str, str], int, int]: Mapping of original URL to fingerprinted
+        URL, number of new store entries and number of duplicates.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    manifest = {}
+    seen = set()
+    created = duplicates = 0
+    for root, _, files in os.walk(assets_dir):
+        for fname in sorted(files):
+            src = os.path.join(root, fname)
+            ext = os.path.splitext(fname)[1].lower()
+            digest = file_digest(src)
+            hashed_name = digest[:HASH_LENGTH] + ext
+            dst = os.path.join(store_dir, hashed_name)
+            if hashed_name in seen:
+                duplicates += 1
+            elif not os.path.exists(dst) or file_digest(dst) != digest:
+                store_copy(src, dst)
+                created += 1
+            seen.add(hashed_name)
+            url = "/" + os.path.relpath(src, public_dir).replace(os.sep, "/")
+            manifest[url] = STORE_URL_PREFIX + hashed_name
+    return manifest, created, duplicates
+
+
+def rewrite_spirit_list(spirits, manifest):
+    """
+    Returns a copy of the spirit list with Model URL / Image URL replaced by
+    their fingerprinted paths, and the URLs without a matching asset.
+    """
+    rewritten = []
+    missing = []
+    for entry in spirits:
+        entry = dict(entry)
+        for field in URL_FIELDS:
+            url = entry.get(field)
+            if not url:
+                continue
+            hashed = manifest.get(urllib.parse.unquote(url))
+            if hashed:
+                entry[field] = hashed
+            else:
+                missing.append(url)
+        rewritten.append(entry)
+    return rewritten, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Publish assets into a content-addressed store and write the URL manifest used by the server"
+    )
+    parser.add_argument(
+        "--root", "-r",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+        help="Repository root (default: parent of the scripts directory)",
+    )
+    parser.add_argument(
+        "--spirits", "-s",
+        help=f"Spirit list to check against the manifest (default: <root>/{SPIRIT_LIST}, not modified)",
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help=f"Where to write the asset manifest (default: <root>/{MANIFEST_PATH})",
+    )
+    parser.add_argument(
+        "--list_output",
+        help="Optionally also write a copy of the spirit list with fingerprinted URLs",
+    )
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    public_dir = os.path.join(root, PUBLIC_DIR)
+    store_dir = os.path.join(root, STORE_DIR)
+    spirits_path = args.spirits or os.path.join(root, SPIRIT_LIST)
+    manifest_path = args.output or os.path.join(root, MANIFEST_PATH)
+
+    manifest, created, duplicates = publish(os.path.join(root, ASSETS_DIR), store_dir, public_dir)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+    print(f"{len(manifest)} assets published, {created} new store entries, {duplicates} duplicates.")
+    print(f"Manifest written: {manifest_path}")
+
+    try:
+        with open(spirits_path, "r", encoding="utf-8") as f:
+            spirits = json.load(f)
+    except Exception as e:
+        print(f"Error: could not load {spirits_path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    rewritten, missing = rewrite_spirit_list(spirits, manifest)
+    if args.list_output:
+        with open(args.list_output, "w", encoding="utf-8") as f:
+            json.dump(rewritten, f, indent=2, ensure_ascii=False)
+        print(f"Fingerprinted spirit list written: {args.list_output}")
+    if missing:
+        print(f"No asset found for {len(missing)} URLs:", file=sys.stderr)
+        for url in missing:
+            print(f"  - {url}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
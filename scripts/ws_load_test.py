@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+import websockets
+
+DEFAULT_URL = "ws://localhost:3000"
+PERCENTILES = (50, 90, 99, 100)
+# Tolerance for timer drift when deriving expected broadcasts from the interval
+BROADCAST_SLACK_S = 1.0
+
+
+def percentile(values, p):
+    """
+    Linearly interpolated percentile (p in 0..100) of a list of numbers.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    f = int(k)
+    c = min(f + 1, len(values) - 1)
+    return values[f] + (values[c] - values[f]) * (k - f)
+
+
+def summarize(values):
+    """
+    Returns count and percentiles of a list, rounded for the report.
+    """
+    summary = {"count": len(values)}
+    for p in PERCENTILES:
+        value = percentile(values, p)
+        summary[f"p{p}"] = round(value, 2) if value is not None else None
+    return summary
+
+
+async def run_client(url, record, delay, open_timeout):
+    """
+    Simulates one viewer: connects, then records every `spirit` message.
+
+    The record dict is filled in place so results survive cancellation.
+    """
+    if delay:
+        await asyncio.sleep(delay)
+    started = time.perf_counter()
+    try:
+        async with websockets.connect(url, open_timeout=open_timeout, max_size=None) as ws:
+            record["connected_at"] = time.perf_counter()
+            record["connect_ms"] = (record["connected_at"] - started) * 1000
+            record["socket"] = ws
+            async for raw in ws:
+                received = time.perf_counter()
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    continue
+                if msg.get("type") != "spirit":
+                    continue
+                size = len(raw) if isinstance(raw, bytes) else len(raw.encode("utf-8"))
+                record["messages"].append({
+                    "received": received,
+                    "bytes": size,
+                    "name": (msg.get("data") or {}).get("Name"),
+                    "time_since_spawn_ms": msg.get("timeSinceSpawnMs", 0),
+                })
+    except websockets.ConnectionClosed:
+        pass
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    if record["closed_at"] is None:
+        record["closed_at"] = time.perf_counter()
+
+
+def start_clients(url, count, ramp, open_timeout):
+    """
+    Starts count clients, spreading the connects evenly over ramp seconds.
+    """
+    records = []
+    tasks = []
+    for i in range(count):
+        record = {
+            "connect_ms": None, "connected_at": None, "closed_at": None,
+            "socket": None, "error": None, "messages": [],
+        }
+        records.append(record)
+        delay = ramp * i / count if ramp else 0
+        tasks.append(asyncio.create_task(run_client(url, record, delay, open_timeout)))
+    return records, tasks
+
+
+async def stop_clients(records, tasks, timeout=10):
+    """
+    Closes all open sockets at once and waits for the client tasks to finish.
+    """
+    now = time.perf_counter()
+    for r in records:
+        if r["closed_at"] is None:
+            r["closed_at"] = now
+    sockets = [r["socket"] for r in records if r["socket"] is not None]
+    await asyncio.gather(*(ws.close() for ws in sockets), return_exceptions=True)
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def cluster_receipts(receipts, gap):
+    """
+    Groups (name, time) receipts into deliveries of the same spirit.
+
+    The same name only repeats after a full reshuffle, but receipts further
+    apart than gap seconds are still split into separate deliveries.
+    """
+    by_name = {}
+    for name, t in receipts:
+        by_name.setdefault(name, []).append(t)
+    clusters = []
+    for times in by_name.values():
+        times.sort()
+        current = [times[0]]
+        for t in times[1:]:
+            if t - current[-1] > gap:
+                clusters.append(current)
+                current = []
+            current.append(t)
+        clusters.append(current)
+    return clusters
+
+
+def expected_broadcasts(start, end, interval_s):
+    """
+    Minimum number of timer broadcasts the server must send within [start, end].
+    """
+    return max(int((end - start - BROADCAST_SLACK_S) // interval_s), 0)
+
+
+def analyze(records, interval_s):
+    """
+    Computes connect latency, first-message latency, message sizes, broadcast
+    fan-out skew and spawn synchronization error for one set of clients.
+
+    A client is expected to receive every broadcast observed by any client
+    while it was connected, and at least as many as the interval allows for
+    its connected time; so broadcasts that reach one or no client count as
+    missed too.
+
+    Skew is measured on a single clock (all clients share this process), so it
+    also contains this process' own scheduling delay.
+    """
+    connected = [r for r in records if r["connect_ms"] is not None]
+    errors = {}
+    for r in records:
+        if r["error"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+
+    first_message = [
+        (r["messages"][0]["received"] - r["connected_at"]) * 1000
+        for r in connected if r["messages"]
+    ]
+    broadcasts = []
+    spawns = []
+    for r in connected:
+        for m in r["messages"]:
+            if m["time_since_spawn_ms"] == 0:
+                broadcasts.append((m["name"], m["received"]))
+            # Spawn time as the client reconstructs it from timeSinceSpawnMs
+            spawns.append((m["name"], m["received"] - m["time_since_spawn_ms"] / 1000))
+
+    gap = interval_s / 2
+    broadcast_clusters = cluster_receipts(broadcasts, gap) if broadcasts else []
+    fanout_skew = [(max(c) - min(c)) * 1000 for c in broadcast_clusters if len(c) > 1]
+    sync_error = [(max(c) - min(c)) * 1000 for c in cluster_receipts(spawns, gap) if len(c) > 1] if spawns else []
+
+    missed = 0
+    for r in connected:
+        observed = sum(1 for c in broadcast_clusters if r["connected_at"] < min(c) < r["closed_at"])
+        expected = max(observed, expected_broadcasts(r["connected_at"], r["closed_at"], interval_s))
+        received = sum(1 for m in r["messages"] if m["time_since_spawn_ms"] == 0)
+        missed += max(expected - received, 0)
+    expected_total = 0
+    if connected:
+        expected_total = expected_broadcasts(
+            min(r["connected_at"] for r in connected), max(r["closed_at"] for r in connected), interval_s
+        )
+
+    return {
+        "clients": len(records),
+        "connected": len(connected),
+        "failed": len(records) - len(connected),
+        "errors": errors,
+        "connect_ms": summarize([r["connect_ms"] for r in connected]),
+        "first_message_ms": summarize(first_message),
+        "message_bytes": summarize([m["bytes"] for r in connected for m in r["messages"]]),
+        "broadcasts": len(broadcast_clusters),
+        "expected_broadcasts": expected_total,
+        "missed_deliveries": missed,
+        "fanout_skew_ms": summarize(fanout_skew),
+        "spawn_sync_error_ms": summarize(sync_error),
+    }
+
+
+async def run_step(url, count, duration, ramp, open_timeout, interval_s, storm):
+    """
+    Runs count clients for duration seconds, optionally followed by a
+    reconnect storm (all clients drop and reconnect at the same moment).
+
+    For the storm an extra sentinel client (not part of the report) stays
+    connected throughout, so the server keeps its spirit timer running and
+    the reconnecting clients hit a live broadcast instead of a cold start.
+    """
+    sentinel = start_clients(url, 1, 0, open_timeout) if storm else None
+    records, tasks = start_clients(url, count, ramp, open_timeout)
+    await asyncio.sleep(ramp + duration)
+    await stop_clients(records, tasks)
+    report = {"steady": analyze(records, interval_s)}
+
+    if storm:
+        records, tasks = start_clients(url, count, 0, open_timeout)
+        # Connects may take up to open_timeout, then stay for at least one broadcast
+        await asyncio.sleep(open_timeout + interval_s + 2 * BROADCAST_SLACK_S)
+        await stop_clients(records, tasks)
+        report["reconnect_storm"] = analyze(records, interval_s)
+        await stop_clients(*sentinel)
+    return report
+
+
+def is_broken(step, max_skew_ms):
+    """
+    A step counts as broken when clients fail, miss broadcasts or drift apart.
+    """
+    for phase in step.values():
+        if phase["failed"] or phase["missed_deliveries"]:
+            return True
+        if phase["broadcasts"] < phase["expected_broadcasts"]:
+            return True
+        for key in ("fanout_skew_ms", "spawn_sync_error_ms"):
+            p99 = phase[key]["p99"]
+            if p99 is not None and p99 > max_skew_ms:
+                return True
+    return False
+
+
+def raise_fd_limit():
+    """
+    Every simulated client needs a file descriptor.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def print_step(count, step):
+    for phase_name, phase in step.items():
+        print(
+            f"  [{count:>6} clients | {phase_name}] "
+            f"connected {phase['connected']}/{phase['clients']}, "
+            f"connect p50/p99 {phase['connect_ms']['p50']}/{phase['connect_ms']['p99']} ms, "
+            f"fan-out skew p99 {phase['fanout_skew_ms']['p99']} ms, "
+            f"sync error p99 {phase['spawn_sync_error_ms']['p99']} ms, "
+            f"broadcasts {phase['broadcasts']}/{phase['expected_broadcasts']}, "
+            f"missed {phase['missed_deliveries']}"
+        )
+
+
+async def run(args):
+    counts = [int(c) for c in args.clients.split(",")]
+    report = {"url": args.url, "steps": {}, "breaks_at": None}
+    for count in counts:
+        print(f"→ {count} clients …")
+        step = await run_step(
+            args.url, count, args.duration, args.ramp, args.open_timeout,
+            args.interval / 1000, args.storm,
+        )
+        step_broken = is_broken(step, args.max_skew_ms)
+        step["broken"] = step_broken
+        report["steps"][str(count)] = step
+        print_step(count, {k: v for k, v in step.items() if k != "broken"})
+        if step_broken and report["breaks_at"] is None:
+            report["breaks_at"] = count
+            if args.stop_on_break:
+                break
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test for the spirit WebSocket broadcast with many simulated clients"
+    )
+    parser.add_argument("--url", "-u", default=DEFAULT_URL, help="WebSocket URL of the server")
+    parser.add_argument(
+        "--clients", "-n",
+        default="10,100,500,1000",
+        help="Comma-separated client counts, run one after another",
+    )
+    parser.add_argument(
+        "--duration", "-d",
+        type=float,
+        default=40,
+        help="Seconds each step stays connected (should cover at least two spirit intervals)",
+    )
+    parser.add_argument("--ramp", type=float, default=0, help="Spread the initial connects over this many seconds")
+    parser.add_argument("--open_timeout", type=float, default=10, help="WebSocket handshake timeout in seconds")
+    parser.add_argument("--interval", type=int, default=18000, help="Spirit interval of the server in ms")
+    parser.add_argument("--storm", action="store_true", help="Reconnect all clients at once after each step")
+    parser.add_argument(
+        "--max_skew_ms",
+        type=float,
+        default=250,
+        help="p99 fan-out skew / sync error above which a step counts as broken",
+    )
+    parser.add_argument("--stop_on_break", action="store_true", help="Stop at the first broken step")
+    parser.add_argument("--output", "-o", default="ws_load_report.json", help="Path of the JSON report")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    try:
+        report = asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("Aborted.", file=sys.stderr)
+        sys.exit(1)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    if report["breaks_at"] is not None:
+        print(f"Synchronization breaks down at {report['breaks_at']} clients.")
+    else:
+        print("No breakdown detected.")
+    print(f"Report written: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -156,6 +156,7 @@ class SpinnerController {
         this.ws = null;
         this.reconnectDelay = 2000;
         this.connected = false;
+        this.prefetched = new Set();
 
         // Sanfte Übergänge
         this.transition = {
@@ -294,13 +295,16 @@ class SpinnerController {
         this.ws.addEventListener('message', async (event) => {
             const msg = JSON.parse(event.data);
             if (msg.type === 'spirit') {
+                let spawned;
                 if (typeof msg.timeSinceSpawnMs === "number" && msg.timeSinceSpawnMs > 0) {
                     // Initiale Verbindung: Mit Offset
-                    this.spawnSpiritWithOffset(msg.data, msg.timeSinceSpawnMs, msg.spiritIntervalMs);
+                    spawned = this.spawnSpiritWithOffset(msg.data, msg.timeSinceSpawnMs, msg.spiritIntervalMs);
                 } else {
                     // Normales Timer-Event
-                    this.spawnSpirit(msg.data);
+                    spawned = this.spawnSpirit(msg.data);
                 }
+                // Erst nach dem aktuellen Spirit die nächsten vorladen
+                spawned.finally(() => this.prefetchAssets(msg.prefetch));
             }
         });
         this.ws.addEventListener('close', () => {
@@ -315,6 +319,18 @@ class SpinnerController {
         });
     }
 
+    // Kommende Modelle/Bilder in den HTTP-Cache laden (Liste aus spirit_schedule.json)
+    prefetchAssets(list) {
+        if (!Array.isArray(list)) return;
+        for (const { url } of list) {
+            if (!url || this.prefetched.has(url)) continue;
+            this.prefetched.add(url);
+            fetch(url, { priority: 'low' })
+                .then(res => res.blob())
+                .catch(() => this.prefetched.delete(url));
+        }
+    }
+
     // --- Jetzt Methoden am Spinner! ---
     async spawnSpirit(spiritData) {
         let spawnPos = {
@@ -17,10 +17,17 @@ const SPIRIT_INTERVAL_MS = 18000; // 20 Sekunden
 let lastSpiritSpawn = Date.now();
 let spiritTimer = null;
 
+// Fingerprinted Assets (scripts/publish_assets.py): Inhalt ändert sich nie -> dauerhaft cachen
+app.use('/cas', express.static(path.join(__dirname, 'public', 'cas'), { immutable: true, maxAge: '1y' }));
 app.use(express.static(path.join(__dirname, 'public')));
 
 const SPIRITS_PATH = path.join(__dirname, '.', 'spirits', 'spirit_list.json');
+// Optional: feste Reihenfolge + Prefetch-Listen (scripts/generate_schedule.py)
+const SCHEDULE_PATH = path.join(__dirname, '.', 'spirits', 'spirit_schedule.json');
+// Optional: /assets/... -> /cas/<hash> (scripts/publish_assets.py)
+const MANIFEST_PATH = path.join(__dirname, '.', 'spirits', 'asset-manifest.json');
 let spirits = [];
+let schedule = null;
 function shuffleArray(arr) {
   for (let i = arr.length - 1; i > 0; i--) {
     const j = Math.floor(Math.random() * (i + 1));
@@ -28,10 +35,52 @@ function shuffleArray(arr) {
   }
 }
 
+// Ersetzt Model/Image URL durch die fingerprinted Pfade, Quell-Liste bleibt unverändert
+function applyAssetManifest(list) {
+  if (!fs.existsSync(MANIFEST_PATH)) return;
+  const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf8'));
+  for (const spirit of list) {
+    for (const field of ['Model URL', 'Image URL']) {
+      const url = spirit[field];
+      if (!url) continue;
+      let key = url;
+      try { key = decodeURI(url); } catch (e) { /* URL unverändert verwenden */ }
+      if (manifest[key]) spirit[field] = manifest[key];
+    }
+  }
+  console.log('[Server] Asset-Manifest angewendet');
+}
+
+// Ordnet die Spirits nach dem Schedule; null, wenn Schedule und Liste nicht zusammenpassen
+function applySchedule(list, doc) {
+  const slots = doc && doc.slots;
+  if (!Array.isArray(slots) || slots.length !== list.length) return null;
+  const used = new Set();
+  for (const slot of slots) {
+    const spirit = list[slot.index];
+    if (!spirit || used.has(slot.index)) return null;
+    if (spirit.Name !== slot.Name || spirit['Model URL'] !== slot['Model URL']) return null;
+    used.add(slot.index);
+  }
+  return slots.map(slot => list[slot.index]);
+}
+
 try {
   spirits = JSON.parse(fs.readFileSync(SPIRITS_PATH, 'utf8'));
   if (!Array.isArray(spirits) || spirits.length === 0) throw 'Spirit-Liste leer oder ungültig!';
-  shuffleArray(spirits);
+  if (fs.existsSync(SCHEDULE_PATH)) {
+    const doc = JSON.parse(fs.readFileSync(SCHEDULE_PATH, 'utf8'));
+    const ordered = applySchedule(spirits, doc);
+    if (ordered) {
+      spirits = ordered;
+      schedule = { prefetch: doc.prefetch || 0 };
+      console.log(`[Server] Spirit-Schedule geladen (${spirits.length} Slots)`);
+    } else {
+      console.warn('[Server] Spirit-Schedule passt nicht zur Spirit-Liste, wird ignoriert (neu generieren!)');
+    }
+  }
+  if (!schedule) shuffleArray(spirits);
+  applyAssetManifest(spirits);
 } catch (e) {
   console.error('Fehler beim Laden der Spirits:', e);
   process.exit(1);
@@ -41,22 +90,40 @@ try {
 function nextSpirit() {
   spiritPos++;
   if (spiritPos >= spirits.length) {
-    shuffleArray(spirits);
+    if (!schedule) shuffleArray(spirits); // Schedule läuft in fester Reihenfolge weiter
     spiritPos = 0;
   }
   lastSpiritSpawn = Date.now();
 }
 
+// Modelle/Bilder der nächsten Spirits im Schedule (nach Asset-Manifest)
+function prefetchList() {
+  if (!schedule) return [];
+  const list = [];
+  for (let k = 1; k <= Math.min(schedule.prefetch, spirits.length - 1); k++) {
+    const next = spirits[(spiritPos + k) % spirits.length];
+    for (const field of ['Model URL', 'Image URL']) {
+      if (next[field]) list.push({ url: next[field] });
+    }
+  }
+  return list;
+}
+
+function spiritPayload(timeSinceSpawnMs) {
+  return JSON.stringify({
+    type: 'spirit',
+    data: spirits[spiritPos],
+    timeSinceSpawnMs,
+    spiritIntervalMs: SPIRIT_INTERVAL_MS,
+    prefetch: prefetchList()
+  });
+}
+
 // --- WebSocket Logik ---
 function pushSpiritToAllClients() {
   const spirit = spirits[spiritPos];
   lastSpiritSpawn = Date.now();
-  const payload = JSON.stringify({
-    type: 'spirit',
-    data: spirit,
-    timeSinceSpawnMs: 0,
-    spiritIntervalMs: SPIRIT_INTERVAL_MS
-  });
+  const payload = spiritPayload(0);
   wss.clients.forEach(client => {
     if (client.readyState === ws.OPEN) {
       client.send(payload);
@@ -103,15 +170,9 @@ wss.on('connection', (socket) => {
   // Zeit seit letztem Spirit-Spawn:
   const now = Date.now();
   const timeSinceSpawnMs = now - lastSpiritSpawn;
-  const spirit = spirits[spiritPos];
 
-  // Sende Spirit, Zeitdifferenz und Intervall an neuen Client
-  socket.send(JSON.stringify({
-    type: 'spirit',
-    data: spirit,
-    timeSinceSpawnMs,
-    spiritIntervalMs: SPIRIT_INTERVAL_MS
-  }));
+  // Sende Spirit, Zeitdifferenz, Intervall und Prefetch-Liste an neuen Client
+  socket.send(spiritPayload(timeSinceSpawnMs));
 
 
   // Timer starten, falls es der erste Client ist: